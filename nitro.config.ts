@@ -56,6 +56,9 @@ if (process.env.VERCEL) {
       },
     },
   }
+} else if (process.env.CLUSTER) {
+  // 多进程运行，进程数由运行时的 NITRO_CLUSTER_WORKERS 决定，默认为 CPU 核数
+  nitroOption.preset = "node-cluster"
 } else if (process.env.BUN) {
   nitroOption.preset = "bun"
   nitroOption.database = {
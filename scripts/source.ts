@@ -1,10 +1,29 @@
-import { writeFileSync } from "node:fs"
+import { closeSync, fsyncSync, openSync, renameSync, rmSync, writeFileSync } from "node:fs"
 import { join } from "node:path"
 import { pinyin } from "@napi-rs/pinyin"
 import { consola } from "consola"
 import { projectDir } from "../shared/dir"
 import { genSources } from "../shared/pre-sources"
 
+// 先写临时文件再 rename，dev server 读到的要么是旧文件，要么是完整的新文件
+function writeFileAtomic(path: string, data: string) {
+  const tmp = `${path}.tmp`
+  try {
+    const fd = openSync(tmp, "w")
+    try {
+      writeFileSync(fd, data)
+      // 确保内容落盘后再 rename，否则断电后可能得到一个空文件
+      fsyncSync(fd)
+    } finally {
+      closeSync(fd)
+    }
+    renameSync(tmp, path)
+  } catch (e) {
+    rmSync(tmp, { force: true })
+    throw e
+  }
+}
+
 const sources = genSources()
 try {
   const pinyinMap = Object.fromEntries(Object.entries(sources)
@@ -13,14 +32,14 @@ try {
       return [k, pinyin(v.title ? `${v.name}-${v.title}` : v.name).join("")]
     }))
 
-  writeFileSync(join(projectDir, "./shared/pinyin.json"), JSON.stringify(pinyinMap, undefined, 2))
+  writeFileAtomic(join(projectDir, "./shared/pinyin.json"), JSON.stringify(pinyinMap, undefined, 2))
   consola.info("Generated pinyin.json")
 } catch {
   consola.error("Failed to generate pinyin.json")
 }
 
 try {
-  writeFileSync(join(projectDir, "./shared/sources.json"), JSON.stringify(Object.fromEntries(Object.entries(sources)), undefined, 2))
+  writeFileAtomic(join(projectDir, "./shared/sources.json"), JSON.stringify(Object.fromEntries(Object.entries(sources)), undefined, 2))
   consola.info("Generated sources.json")
 } catch {
   consola.error("Failed to generate sources.json")
@@ -7,7 +7,7 @@ export default defineEventHandler(async (event) => {
   const server = getServer()
   try {
     const transport: StreamableHTTPServerTransport = new StreamableHTTPServerTransport({ sessionIdGenerator: undefined })
-    transport.onerror = console.error.bind(console)
+    transport.onerror = e => logger.error(e)
     await server.connect(transport)
     await transport.handleRequest(req, res, await readBody(event))
     res.on("close", () => {
@@ -17,7 +17,7 @@ export default defineEventHandler(async (event) => {
     })
     return res
   } catch (e) {
-    console.error(e)
+    logger.error(e)
     return {
       jsonrpc: "2.0",
       error: {
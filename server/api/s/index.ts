@@ -1,9 +1,13 @@
-import type { SourceID, SourceResponse } from "@shared/types"
+import process from "node:process"
+import type { NewsItem, SourceID, SourceResponse } from "@shared/types"
 import { getters } from "#/getters"
 import { getCacheTable } from "#/database/cache"
 import type { CacheInfo } from "#/types"
 
-export default defineEventHandler(async (event): Promise<SourceResponse> => {
+// 正在抓取的源，同一个源的并发请求共用一次抓取
+const fetching = new Map<SourceID, Promise<NewsItem[]>>()
+
+export default defineEventHandler(async (event): Promise<SourceResponse | void> => {
   try {
     const query = getQuery(event)
     const latest = query.latest !== undefined && query.latest !== "false"
@@ -44,6 +48,14 @@ export default defineEventHandler(async (event): Promise<SourceResponse> => {
           // 没有 latest
           // 有 latest，服务器可以登录但没有登录
           if (!latest || (!event.context.disabledLogin && !event.context.user)) {
+            // 返回内容只取决于缓存的更新时间，浏览器带上 ETag 时可以直接 304
+            // 是否走缓存和登录状态有关，所以只允许浏览器缓存（private），不用 handleCacheHeaders，它总会加上 public
+            const etag = `W/"${id}-${cache.updated}"`
+            setResponseHeaders(event, {
+              "ETag": etag,
+              "Cache-Control": "private, no-cache",
+            })
+            if (getRequestHeader(event, "if-none-match") === etag) return sendNoContent(event, 304)
             return {
               status: "cache",
               id,
@@ -56,8 +68,18 @@ export default defineEventHandler(async (event): Promise<SourceResponse> => {
     }
 
     try {
-      const newData = (await getters[id]()).slice(0, 30)
-      if (cacheTable && newData.length) {
+      // Cloudflare Worker 里不能跨请求共享 Promise
+      let task = process.env.CF_PAGES ? undefined : fetching.get(id)
+      const isFirst = !task
+      if (!task) {
+        task = getters[id]()
+          .then(data => data.slice(0, MaxItems))
+          .finally(() => fetching.delete(id))
+        if (!process.env.CF_PAGES) fetching.set(id, task)
+      }
+      const newData = await task
+      // 只由发起抓取的请求写缓存
+      if (isFirst && cacheTable && newData.length) {
         if (event.context.waitUntil) event.context.waitUntil(cacheTable.set(id, newData))
         else await cacheTable.set(id, newData)
       }
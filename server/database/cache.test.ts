@@ -0,0 +1,48 @@
+import { beforeAll, describe, expect, it } from "vitest"
+import { createDatabase } from "db0"
+import sqlite from "db0/connectors/better-sqlite3"
+import type { NewsItem } from "@shared/types"
+import { Cache } from "./cache"
+
+describe("cache memo", () => {
+  const db = createDatabase(sqlite({ name: ":memory:" }))
+  const cache = new Cache(db)
+  const items = (title: string): NewsItem[] => [{ id: title, title, url: `https://example.com/${title}` }]
+
+  beforeAll(async () => {
+    await cache.init()
+  })
+
+  it("get returns the memoized object while updated is unchanged", async () => {
+    await cache.set("a", items("a"))
+    const first = await cache.get("a")
+    const second = await cache.get("a")
+    expect(first).toBeDefined()
+    expect(second).toBe(first)
+  })
+
+  it("get re-parses after another writer bumps updated", async () => {
+    await cache.set("b", items("b"))
+    const first = await cache.get("b")
+    // 模拟另一个进程写入
+    await db.prepare(`UPDATE cache SET data = ?, updated = ? WHERE id = ?`)
+      .run(JSON.stringify(items("b2")), first!.updated + 1000, "b")
+    const second = await cache.get("b")
+    expect(second).not.toBe(first)
+    expect(second!.updated).toBe(first!.updated + 1000)
+    expect(second!.items[0].title).toBe("b2")
+  })
+
+  it("get returns undefined after the row is deleted", async () => {
+    await cache.set("c", items("c"))
+    await db.prepare(`DELETE FROM cache WHERE id = ?`).run("c")
+    expect(await cache.get("c")).toBeUndefined()
+  })
+
+  it("getEntire reuses memo entries", async () => {
+    await cache.set("d", items("d"))
+    const memoized = await cache.get("d")
+    const [entire] = await cache.getEntire(["d"])
+    expect(entire).toBe(memoized)
+  })
+})
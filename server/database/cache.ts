@@ -3,6 +3,9 @@ import type { NewsItem } from "@shared/types"
 import type { Database } from "db0"
 import type { CacheInfo, CacheRow } from "../types"
 
+// 内存中保留解析后的缓存，updated 没变就不用再读取和 JSON.parse 整个 data
+const memo = new Map<string, CacheInfo>()
+
 export class Cache {
   private db
   constructor(db: Database) {
@@ -25,18 +28,33 @@ export class Cache {
     await this.db.prepare(
       `INSERT OR REPLACE INTO cache (id, data, updated) VALUES (?, ?, ?)`,
     ).run(key, JSON.stringify(value), now)
+    memo.set(key, { id: key as CacheInfo["id"], updated: now, items: value })
     logger.success(`set ${key} cache`)
   }
 
   async get(key: string): Promise<CacheInfo | undefined > {
+    const cached = memo.get(key)
+    if (cached) {
+      const row = (await this.db.prepare(`SELECT updated FROM cache WHERE id = ?`).get(key)) as Pick<CacheRow, "updated"> | undefined
+      if (!row) {
+        memo.delete(key)
+        return
+      }
+      if (row.updated === cached.updated) {
+        logger.success(`get ${key} cache`)
+        return cached
+      }
+    }
     const row = (await this.db.prepare(`SELECT id, data, updated FROM cache WHERE id = ?`).get(key)) as CacheRow | undefined
     if (row) {
       logger.success(`get ${key} cache`)
-      return {
+      const cache = {
         id: row.id,
         updated: row.updated,
         items: JSON.parse(row.data),
       }
+      memo.set(key, cache)
+      return cache
     }
   }
 
@@ -56,28 +74,40 @@ export class Cache {
      */
     if (rows?.length) {
       logger.success(`get entire (...) cache`)
-      return rows.map(row => ({
-        id: row.id,
-        updated: row.updated,
-        items: JSON.parse(row.data) as NewsItem[],
-      }))
+      return rows.map((row) => {
+        const cached = memo.get(row.id)
+        if (cached?.updated === row.updated) return cached
+        const cache = {
+          id: row.id,
+          updated: row.updated,
+          items: JSON.parse(row.data) as NewsItem[],
+        }
+        memo.set(row.id, cache)
+        return cache
+      })
     } else {
       return []
     }
   }
 
   async delete(key: string) {
+    memo.delete(key)
     return await this.db.prepare(`DELETE FROM cache WHERE id = ?`).run(key)
   }
 }
 
+// 建表只需要一次，之后的请求直接复用
+let cacheTable: Cache | undefined
+
 export async function getCacheTable() {
   try {
+    if (cacheTable) return cacheTable
     const db = useDatabase()
     // logger.info("db: ", db.getInstance())
     if (process.env.ENABLE_CACHE === "false") return
-    const cacheTable = new Cache(db)
-    if (process.env.INIT_TABLE !== "false") await cacheTable.init()
+    const table = new Cache(db)
+    if (process.env.INIT_TABLE !== "false") await table.init()
+    cacheTable = table
     return cacheTable
   } catch (e) {
     logger.error("failed to init database ", e)
@@ -38,7 +38,7 @@ export function getServer() {
     },
   )
 
-  server.server.onerror = console.error.bind(console)
+  server.server.onerror = e => logger.error(e)
 
   return server
 }
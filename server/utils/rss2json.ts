@@ -1,27 +1,40 @@
 import { XMLParser } from "fast-xml-parser"
 import type { RSSInfo } from "../types"
 
+// 记录每个 feed 的 ETag/Last-Modified，内容没变时服务器返回 304，直接复用上次解析的结果
+const feeds = new Map<string, { etag?: string, lastModified?: string, rss: RSSInfo }>()
+
+const xml = new XMLParser({
+  attributeNamePrefix: "",
+  textNodeName: "$text",
+  ignoreAttributes: false,
+  // 正文往往是整段 HTML，体积最大却用不到，原样保留，不再逐个标签解析
+  stopNodes: ["*.content", "*.content:encoded"],
+})
+
 export async function rss2json(url: string): Promise<RSSInfo | undefined> {
   if (!/^https?:\/\/[^\s$.?#].\S*/i.test(url)) return
 
-  const data = await myFetch(url)
-
-  const xml = new XMLParser({
-    attributeNamePrefix: "",
-    textNodeName: "$text",
-    ignoreAttributes: false,
-  })
+  const cached = feeds.get(url)
+  const headers: Record<string, string> = {}
+  if (cached?.etag) headers["If-None-Match"] = cached.etag
+  if (cached?.lastModified) headers["If-Modified-Since"] = cached.lastModified
+  const response = await myFetch.raw(url, { headers, responseType: "text" })
+  if (response.status === 304 && cached) return cached.rss
+  const data = response._data ?? ""
 
-  const result = xml.parse(data as string)
+  const result = xml.parse(data)
 
   let channel = result.rss && result.rss.channel ? result.rss.channel : result.feed
   if (Array.isArray(channel)) channel = channel[0]
+  // 返回的不是 RSS/Atom（比如报错页面），直接结束
+  if (!channel) return
 
   const rss = {
     title: channel.title ?? "",
     description: channel.description ?? "",
-    link: channel.link && channel.link.href ? channel.link.href : channel.link,
-    image: channel.image ? channel.image.url : channel["itunes:image"] ? channel["itunes:image"].href : "",
+    link: channel.link?.href || channel.link,
+    image: channel.image ? channel.image.url : channel["itunes:image"]?.href ?? "",
     category: channel.category || [],
     updatedTime: channel.lastBuildDate ?? channel.updated,
     items: [],
@@ -32,50 +45,62 @@ export async function rss2json(url: string): Promise<RSSInfo | undefined> {
 
   for (let i = 0; i < items.length; i++) {
     const val = items[i]
-    const media = {}
 
+    // 所有字段（包括扩展字段和 media）都在字面量里声明，不再事后添加，保持对象结构一致
     const obj = {
-      id: val.guid && val.guid.$text ? val.guid.$text : val.id,
-      title: val.title && val.title.$text ? val.title.$text : val.title,
-      description: val.summary && val.summary.$text ? val.summary.$text : val.description,
-      link: val.link && val.link.href ? val.link.href : val.link,
-      author: val.author && val.author.name ? val.author.name : val["dc:creator"],
+      id: val.guid?.$text || val.id,
+      title: val.title?.$text || val.title,
+      description: val.summary?.$text || val.description,
+      link: val.link?.href || val.link,
+      author: val.author?.name || val["dc:creator"],
       created: val.updated ?? val.pubDate ?? val.created,
       category: val.category || [],
-      content: val.content && val.content.$text ? val.content.$text : val["content:encoded"],
+      content: val.content?.$text || val["content:encoded"],
       enclosures: val.enclosure ? (Array.isArray(val.enclosure) ? val.enclosure : [val.enclosure]) : [],
-    };
-
-    ["content:encoded", "podcast:transcript", "itunes:summary", "itunes:author", "itunes:explicit", "itunes:duration", "itunes:season", "itunes:episode", "itunes:episodeType", "itunes:image"].forEach((s) => {
-      // @ts-expect-error TODO
-      if (val[s]) obj[s.replace(":", "_")] = val[s]
-    })
+      media: {} as { thumbnail?: any },
+      content_encoded: val["content:encoded"] || undefined,
+      podcast_transcript: val["podcast:transcript"] || undefined,
+      itunes_summary: val["itunes:summary"] || undefined,
+      itunes_author: val["itunes:author"] || undefined,
+      itunes_explicit: val["itunes:explicit"] || undefined,
+      itunes_duration: val["itunes:duration"] || undefined,
+      itunes_season: val["itunes:season"] || undefined,
+      itunes_episode: val["itunes:episode"] || undefined,
+      itunes_episodeType: val["itunes:episodeType"] || undefined,
+      itunes_image: val["itunes:image"] || undefined,
+    }
 
-    if (val["media:thumbnail"]) {
-      Object.assign(media, { thumbnail: val["media:thumbnail"] })
-      obj.enclosures.push(val["media:thumbnail"])
+    const thumbnail = val["media:thumbnail"]
+    if (thumbnail) {
+      obj.media.thumbnail = thumbnail
+      obj.enclosures.push(thumbnail)
     }
 
-    if (val["media:content"]) {
-      Object.assign(media, { thumbnail: val["media:content"] })
-      obj.enclosures.push(val["media:content"])
+    const content = val["media:content"]
+    if (content) {
+      obj.media.thumbnail = content
+      obj.enclosures.push(content)
     }
 
-    if (val["media:group"]) {
-      if (val["media:group"]["media:title"]) obj.title = val["media:group"]["media:title"]
+    const group = val["media:group"]
+    if (group) {
+      if (group["media:title"]) obj.title = group["media:title"]
 
-      if (val["media:group"]["media:description"]) obj.description = val["media:group"]["media:description"]
+      if (group["media:description"]) obj.description = group["media:description"]
 
-      if (val["media:group"]["media:thumbnail"]) obj.enclosures.push(val["media:group"]["media:thumbnail"].url)
+      if (group["media:thumbnail"]) obj.enclosures.push(group["media:thumbnail"].url)
 
-      if (val["media:group"]["media:content"]) obj.enclosures.push(val["media:group"]["media:content"])
+      if (group["media:content"]) obj.enclosures.push(group["media:content"])
     }
 
-    Object.assign(obj, { media })
-
     // @ts-expect-error TODO
     rss.items.push(obj)
   }
 
+  // 没有 ETag/Last-Modified 就发不了条件请求，存了也用不上
+  const etag = response.headers.get("ETag") ?? undefined
+  const lastModified = response.headers.get("Last-Modified") ?? undefined
+  if (etag || lastModified) feeds.set(url, { etag, lastModified, rss })
+  else feeds.delete(url)
   return rss
 }
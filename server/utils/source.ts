@@ -14,7 +14,8 @@ export function defineRSSSource(url: string, option?: SourceOption): SourceGette
   return async () => {
     const data = await rss2json(url)
     if (!data?.items.length) throw new Error("Cannot fetch rss data")
-    return data.items.map(item => ({
+    // 反正只会返回前 MaxItems 条，后面的就不用再处理了
+    return data.items.slice(0, MaxItems).map(item => ({
       title: item.title,
       url: item.link,
       id: item.link,
@@ -9,6 +9,11 @@ export const TTL = 30 * 60 * 1000
  */
 export const Interval = 10 * 60 * 1000
 
+/**
+ * 每个源最多返回的条数
+ */
+export const MaxItems = 30
+
 export const Homepage = packageJSON.homepage
 
 export const Version = packageJSON.version